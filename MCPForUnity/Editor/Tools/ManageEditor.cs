@@ -102,6 +102,10 @@ namespace MCPForUnity.Editor.Tools
                     return GetCompileStatus();
                 case "wait_for_compile":
                     return WaitForCompile();
+                case "get_compile_snapshot":
+                    return GetCompileSnapshot(@params);
+                case "trigger_recompile":
+                    return TriggerRecompile();
                 case "get_selection":
                     return GetSelection();
                 case "get_prefab_stage":
@@ -148,7 +152,7 @@ namespace MCPForUnity.Editor.Tools
 
                 default:
                     return Response.Error(
-                        $"Unknown action: '{action}'. Supported actions include play, pause, stop, get_state, get_project_root, get_windows, get_active_tool, get_selection, get_prefab_stage, set_active_tool, add_tag, remove_tag, get_tags, add_layer, remove_layer, get_layers."
+                        $"Unknown action: '{action}'. Supported actions include play, pause, stop, get_state, get_project_root, get_windows, get_active_tool, get_selection, get_prefab_stage, set_active_tool, add_tag, remove_tag, get_tags, add_layer, remove_layer, get_layers, get_compile_snapshot, trigger_recompile."
                     );
             }
         }
@@ -167,6 +171,8 @@ namespace MCPForUnity.Editor.Tools
                     applicationPath = EditorApplication.applicationPath,
                     applicationContentsPath = EditorApplication.applicationContentsPath,
                     timeSinceStartup = EditorApplication.timeSinceStartup,
+                    // Lets clients use the wait_compile_complete long-poll without probing for it
+                    supportsWaitCompile = true,
                 };
                 return Response.Success("Retrieved editor state.", state);
             }
@@ -688,6 +694,70 @@ namespace MCPForUnity.Editor.Tools
             }
         }
         
+        /// <summary>
+        /// Returns the compile flags together with compile-relevant console entries
+        /// (errors and warnings) so callers get a consistent snapshot in one round-trip.
+        /// </summary>
+        private static object GetCompileSnapshot(JObject @params)
+        {
+            try
+            {
+                bool isCompiling = EditorApplication.isCompiling;
+                bool isUpdating = EditorApplication.isUpdating;
+                int? count = @params["count"]?.ToObject<int?>() ?? 50;
+                bool includeStacktrace = @params["includeStacktrace"]?.ToObject<bool?>() ?? true;
+
+                // A console read failure must not hide the compile flags; report it alongside them
+                List<object> entries;
+                string entriesError = null;
+                try
+                {
+                    entries = ReadConsole.CollectEntries(
+                        new List<string> { "error", "warning" },
+                        count,
+                        null,
+                        "detailed",
+                        includeStacktrace
+                    );
+                }
+                catch (Exception e)
+                {
+                    entries = new List<object>();
+                    entriesError = e.Message;
+                }
+
+                return Response.Success("Compile snapshot retrieved.", new
+                {
+                    isCompiling,
+                    isUpdating,
+                    entries,
+                    entriesError
+                });
+            }
+            catch (Exception e)
+            {
+                return Response.Error($"Error getting compile snapshot: {e.Message}");
+            }
+        }
+
+        /// <summary>
+        /// Refreshes the asset database and requests a script compilation directly,
+        /// without going through the menu system (works even when menus are unavailable).
+        /// </summary>
+        private static object TriggerRecompile()
+        {
+            try
+            {
+                AssetDatabase.Refresh();
+                UnityEditor.Compilation.CompilationPipeline.RequestScriptCompilation();
+                return Response.Success("Script compilation requested.");
+            }
+            catch (Exception e)
+            {
+                return Response.Error($"Error requesting script compilation: {e.Message}");
+            }
+        }
+
         /// <summary>
         /// Waits for compilation to complete.
         /// </summary>
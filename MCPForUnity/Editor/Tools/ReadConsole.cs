@@ -2,8 +2,10 @@ using System;
 using System.Collections.Generic;
 using System.Linq;
 using System.Reflection;
+using System.Threading;
 using Newtonsoft.Json.Linq;
 using UnityEditor;
+using UnityEditor.Compilation;
 using UnityEditorInternal;
 using UnityEngine;
 using MCPForUnity.Editor.Helpers; // For Response class
@@ -34,9 +36,18 @@ namespace MCPForUnity.Editor.Tools
 
         // Note: Timestamp is not directly available in LogEntry; need to parse message or find alternative?
 
+        // Console version token, bumped whenever the console content may have changed.
+        // Seeded from the clock so a token handed out before a domain reload is never reused.
+        private static long _consoleVersion = DateTime.UtcNow.Ticks;
+        private static int _lastSeenEntryCount = -1;
+
         // Static constructor for reflection setup
         static ReadConsole()
         {
+            Application.logMessageReceivedThreaded += (_, __, ___) => Interlocked.Increment(ref _consoleVersion);
+            CompilationPipeline.compilationStarted += _ => Interlocked.Increment(ref _consoleVersion);
+            CompilationPipeline.compilationFinished += _ => Interlocked.Increment(ref _consoleVersion);
+
             try
             {
                 Type logEntriesType = typeof(EditorApplication).Assembly.GetType(
@@ -125,23 +136,26 @@ namespace MCPForUnity.Editor.Tools
             }
         }
 
+        /// <summary>
+        /// True when ALL required reflection members were successfully initialized.
+        /// </summary>
+        internal static bool IsAvailable =>
+            _startGettingEntriesMethod != null
+            && _endGettingEntriesMethod != null
+            && _clearMethod != null
+            && _getCountMethod != null
+            && _getEntryMethod != null
+            && _modeField != null
+            && _messageField != null
+            && _fileField != null
+            && _lineField != null
+            && _instanceIdField != null;
+
         // --- Main Handler ---
 
         public static object HandleCommand(JObject @params)
         {
-            // Check if ALL required reflection members were successfully initialized.
-            if (
-                _startGettingEntriesMethod == null
-                || _endGettingEntriesMethod == null
-                || _clearMethod == null
-                || _getCountMethod == null
-                || _getEntryMethod == null
-                || _modeField == null
-                || _messageField == null
-                || _fileField == null
-                || _lineField == null
-                || _instanceIdField == null
-            )
+            if (!IsAvailable)
             {
                 // Log the error here as well for easier debugging in Unity Console
                 Debug.LogError(
@@ -172,6 +186,8 @@ namespace MCPForUnity.Editor.Tools
                     string format = (@params["format"]?.ToString() ?? "detailed").ToLower();
                     bool includeStacktrace =
                         @params["includeStacktrace"]?.ToObject<bool?>() ?? true;
+                    long? ifChangedSince = @params["ifChangedSince"]?.ToObject<long?>();
+                    int offset = Math.Max(0, @params["offset"]?.ToObject<int?>() ?? 0);
 
                     if (types.Contains("all"))
                     {
@@ -186,7 +202,21 @@ namespace MCPForUnity.Editor.Tools
                         // Need a way to get timestamp per log entry.
                     }
 
-                    return GetConsoleEntries(types, count, filterText, format, includeStacktrace);
+                    // Read the version before the entries so a log arriving mid-read yields a stale
+                    // (never a too-new) token and the next caller simply refetches.
+                    long version = GetConsoleVersion();
+                    if (ifChangedSince.HasValue && ifChangedSince.Value == version)
+                    {
+                        return new
+                        {
+                            success = true,
+                            message = "Console unchanged.",
+                            unchanged = true,
+                            version,
+                        };
+                    }
+
+                    return GetConsoleEntries(types, count, filterText, format, includeStacktrace, version, offset);
                 }
                 else
                 {
@@ -209,6 +239,7 @@ namespace MCPForUnity.Editor.Tools
             try
             {
                 _clearMethod.Invoke(null, null); // Static method, no instance, no parameters
+                Interlocked.Increment(ref _consoleVersion);
                 return Response.Success("Console cleared successfully.");
             }
             catch (Exception e)
@@ -223,11 +254,76 @@ namespace MCPForUnity.Editor.Tools
             int? count,
             string filterText,
             string format,
-            bool includeStacktrace
+            bool includeStacktrace,
+            long version,
+            int offset
+        )
+        {
+            List<object> formattedEntries;
+            try
+            {
+                formattedEntries = CollectEntries(types, count, filterText, format, includeStacktrace, offset);
+            }
+            catch (Exception e)
+            {
+                Debug.LogError($"[ReadConsole] Error while retrieving log entries: {e}");
+                return Response.Error($"Error retrieving log entries: {e.Message}");
+            }
+
+            // Return the filtered and formatted list (might be empty), tagged with the console
+            // version so callers can cache it and pass it back as 'ifChangedSince', and with
+            // the offset of the next page for callers that read large consoles in batches.
+            return new
+            {
+                success = true,
+                message = $"Retrieved {formattedEntries.Count} log entries.",
+                data = formattedEntries,
+                version,
+                nextOffset = offset + formattedEntries.Count,
+            };
+        }
+
+        /// <summary>
+        /// Returns the current console version token. Entry count changes (e.g. the console
+        /// window's Clear button) also bump the token since they bypass our hooks.
+        /// </summary>
+        internal static long GetConsoleVersion()
+        {
+            int total = (int)_getCountMethod.Invoke(null, null);
+            if (total != _lastSeenEntryCount)
+            {
+                _lastSeenEntryCount = total;
+                Interlocked.Increment(ref _consoleVersion);
+            }
+            return Interlocked.Read(ref _consoleVersion);
+        }
+
+        /// <summary>
+        /// Reads, filters and formats console entries. Shared with other tools that need
+        /// console data in the same shape as a 'get' (e.g. the compile snapshot).
+        /// The first <paramref name="offset"/> matching entries are skipped so large consoles
+        /// can be read page by page. Throws if the entries cannot be read; callers are
+        /// expected to wrap the error.
+        /// </summary>
+        internal static List<object> CollectEntries(
+            List<string> types,
+            int? count,
+            string filterText,
+            string format,
+            bool includeStacktrace,
+            int offset = 0
         )
         {
+            if (!IsAvailable)
+            {
+                throw new InvalidOperationException(
+                    "ReadConsole reflection members are not initialized. Cannot access console logs."
+                );
+            }
+
             List<object> formattedEntries = new List<object>();
             int retrievedCount = 0;
+            int skippedCount = 0;
 
             try
             {
@@ -302,6 +398,13 @@ namespace MCPForUnity.Editor.Tools
 
                     // TODO: Filter by timestamp (requires timestamp data)
 
+                    // Skip entries that belong to earlier pages
+                    if (skippedCount < offset)
+                    {
+                        skippedCount++;
+                        continue;
+                    }
+
                     // --- Formatting ---
                     string stackTrace = includeStacktrace ? ExtractStackTrace(message) : null;
                     // Always get first line for the message, use full message only if no stack trace exists
@@ -348,22 +451,9 @@ namespace MCPForUnity.Editor.Tools
                     }
                 }
             }
-            catch (Exception e)
-            {
-                Debug.LogError($"[ReadConsole] Error while retrieving log entries: {e}");
-                // Ensure EndGettingEntries is called even if there's an error during iteration
-                try
-                {
-                    _endGettingEntriesMethod.Invoke(null, null);
-                }
-                catch
-                { /* Ignore nested exception */
-                }
-                return Response.Error($"Error retrieving log entries: {e.Message}");
-            }
             finally
             {
-                // Ensure we always call EndGettingEntries
+                // Ensure we always call EndGettingEntries, even if iteration failed
                 try
                 {
                     _endGettingEntriesMethod.Invoke(null, null);
@@ -375,11 +465,7 @@ namespace MCPForUnity.Editor.Tools
                 }
             }
 
-            // Return the filtered and formatted list (might be empty)
-            return Response.Success(
-                $"Retrieved {formattedEntries.Count} log entries.",
-                formattedEntries
-            );
+            return formattedEntries;
         }
 
         // --- Internal Helpers ---
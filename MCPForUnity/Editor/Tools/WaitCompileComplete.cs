@@ -0,0 +1,87 @@
+using System;
+using System.Threading.Tasks;
+using MCPForUnity.Editor.Helpers;
+using Newtonsoft.Json.Linq;
+using UnityEditor;
+using UnityEditor.Compilation;
+
+namespace MCPForUnity.Editor.Tools
+{
+    /// <summary>
+    /// Long-polls until the editor stops compiling/updating or the timeout expires, so
+    /// clients get one response per wait instead of polling the compile flags.
+    /// </summary>
+    [McpForUnityTool("wait_compile_complete")]
+    public static class WaitCompileComplete
+    {
+        private const int DefaultTimeoutMs = 5000;
+
+        // Stay below the bridge's per-command response timeout (30 s)
+        private const int MaxTimeoutMs = 25000;
+
+        public static async Task<object> HandleCommand(JObject @params)
+        {
+            int timeoutMs = DefaultTimeoutMs;
+            try
+            {
+                var timeoutToken = @params?["timeoutMs"];
+                if (timeoutToken != null && int.TryParse(timeoutToken.ToString(), out var parsedTimeout) && parsedTimeout > 0)
+                {
+                    timeoutMs = Math.Min(parsedTimeout, MaxTimeoutMs);
+                }
+            }
+            catch
+            {
+                // Preserve default timeout if parsing fails
+            }
+
+            if (IsIdle())
+            {
+                return Response.Success("No compilation in progress.", new { done = true, timeout = false });
+            }
+
+            var idle = new TaskCompletionSource<bool>();
+
+            void Check()
+            {
+                if (IsIdle())
+                {
+                    idle.TrySetResult(true);
+                }
+            }
+
+            void OnCompilationFinished(object _) => Check();
+
+            // Both callbacks run on the main thread; update also covers asset refreshes
+            // (isUpdating) that do not raise a compilation event.
+            CompilationPipeline.compilationFinished += OnCompilationFinished;
+            EditorApplication.update += Check;
+            try
+            {
+                var completed = await Task.WhenAny(idle.Task, Task.Delay(timeoutMs)).ConfigureAwait(true);
+                if (completed != idle.Task)
+                {
+                    return Response.Success($"Still compiling after {timeoutMs} ms.", new
+                    {
+                        done = false,
+                        timeout = true,
+                        isCompiling = EditorApplication.isCompiling,
+                        isUpdating = EditorApplication.isUpdating,
+                    });
+                }
+
+                return Response.Success("Compilation completed.", new { done = true, timeout = false });
+            }
+            finally
+            {
+                CompilationPipeline.compilationFinished -= OnCompilationFinished;
+                EditorApplication.update -= Check;
+            }
+        }
+
+        private static bool IsIdle()
+        {
+            return !EditorApplication.isCompiling && !EditorApplication.isUpdating;
+        }
+    }
+}
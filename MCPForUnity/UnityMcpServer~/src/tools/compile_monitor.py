@@ -1,13 +1,94 @@
 """
 Compile Monitor Tool - Monitors Unity compilation status and provides detailed error reporting.
 """
-from typing import Annotated, Any, Literal
+from concurrent.futures import Future
+from typing import Annotated, Any, Callable, Literal
+import copy
+import json
+import threading
 import time
 
 from fastmcp import Context
 from registry import mcp_for_unity_tool
 from unity_connection import send_command_with_retry
 
+# Response messages (the count-dependent ones are filled with % formatting)
+_MSG_STATUS_OK = "Compilation status retrieved"
+_MSG_WAIT_DONE = "Compilation completed"
+_MSG_RECOMPILE_OK = "Forced recompilation initiated"
+_MSG_ERRORS_FMT = "Retrieved %d compilation errors"
+_MSG_WARNINGS_FMT = "Retrieved %d compilation warnings"
+
+# Polling backoff bounds for wait_for_compilation_complete (seconds)
+_POLL_INITIAL_DELAY = 0.025
+_POLL_MAX_DELAY = 0.5
+
+# Flipped off the first time Unity rejects get_compile_snapshot (plugin predates it)
+_snapshot_supported = True
+
+# Flipped off the first time Unity rejects trigger_recompile; force_recompile then uses the menu
+_trigger_recompile_supported = True
+
+# Per-request window for the wait_compile_complete long-poll (seconds). The transport
+# gives retried wait_compile_complete sends a 30 s receive timeout, which matches the
+# bridge's per-command cap; short windows keep each request well inside both.
+_LONG_POLL_WINDOW = 5.0
+# wait_compile_complete is a top-level command, and the transport retries unknown commands
+# with reconnect backoff. So it is only used once get_state has advertised it
+# (supportsWaitCompile), and is switched off for good if Unity rejects it anyway.
+# None until get_state has been seen.
+_long_poll_supported: bool | None = None
+
+# Short-lived memo of the last successful get_compile_status result so bursts of
+# callers share one round-trip. Mutating actions must clear it (_invalidate_status_cache).
+_STATUS_CACHE_TTL = 0.1
+_status_cache: dict[str, Any] = {"t": 0.0, "v": None}
+_status_lock = threading.Lock()
+
+# Requests currently on the wire, keyed by what they ask for. Concurrent callers with
+# the same key wait for the first one's result instead of sending their own.
+# Each value is [future, follower count].
+_inflight: dict[Any, list] = {}
+_inflight_lock = threading.Lock()
+
+# Console reads for errors/warnings are paged so large consoles are not cut off at one batch
+_CONSOLE_PAGE_SIZE = 500
+_CONSOLE_MAX_ENTRIES = 5000
+
+# Request payloads sent on every call, built once. send_command_with_retry only
+# serializes its params, so these are shared; treat them as read-only.
+_REQ_EDITOR_STATE = {"action": "get_state"}
+_REQ_COMPILE_SNAPSHOT = {"action": "get_compile_snapshot", "count": 50, "includeStacktrace": True}
+_REQ_CONSOLE_STATUS = {"action": "get", "count": 50, "types": ["error", "warning"], "includeStacktrace": True}
+# Unity includes stack traces unless told otherwise; only ask for them when they are returned
+_REQ_CONSOLE_ERRORS = {"action": "get", "count": _CONSOLE_PAGE_SIZE, "types": ["error"], "includeStacktrace": False}
+_REQ_CONSOLE_ERRORS_TRACE = {"action": "get", "count": _CONSOLE_PAGE_SIZE, "types": ["error"], "includeStacktrace": True}
+_REQ_CONSOLE_WARNINGS = {"action": "get", "count": _CONSOLE_PAGE_SIZE, "types": ["warning"], "includeStacktrace": False}
+_REQ_CONSOLE_CLEAR = {"action": "clear"}
+_REQ_TRIGGER_RECOMPILE = {"action": "trigger_recompile"}
+_REQ_MENU_REFRESH = {"menuPath": "Assets/Refresh"}
+
+# Last get_compilation_errors result keyed by Unity's console version token.
+# "ver" is -1 when nothing usable is cached.
+_err_cache: dict[str, Any] = {"ver": -1, "errors": None, "withTrace": None}
+_err_lock = threading.Lock()
+
+
+# Action dispatch table: (ctx, timeout_seconds, include_stack_trace, aggregate_errors) -> result.
+# Each handler resolves only the parameters its action uses. They are lambdas rather than
+# partials so the target functions are looked up at call time.
+_ACTIONS = {
+    "get_status": lambda ctx, timeout, trace, agg: get_compile_status(ctx),
+    # A timeout of 0 (or None) means the default, as before
+    "wait_for_complete": lambda ctx, timeout, trace, agg: wait_for_compilation_complete(ctx, timeout or 30),
+    "get_errors": lambda ctx, timeout, trace, agg: get_compilation_errors(
+        ctx, bool(trace), aggregate=agg is None or agg),
+    "get_warnings": lambda ctx, timeout, trace, agg: get_compilation_warnings(ctx),
+    "clear_errors": lambda ctx, timeout, trace, agg: clear_compilation_errors(ctx),
+    "force_recompile": lambda ctx, timeout, trace, agg: force_recompile(ctx),
+}
+_VALID_ACTIONS = frozenset(_ACTIONS)
+
 
 @mcp_for_unity_tool(
     description="Monitor Unity compilation status and get detailed error reports. Provides real-time compilation monitoring and error analysis."
@@ -17,193 +98,476 @@ def compile_monitor(
     action: Annotated[Literal["get_status", "wait_for_complete", "get_errors", "get_warnings", "clear_errors", "force_recompile"], "Compilation monitoring actions"],
     timeout_seconds: Annotated[int, "Timeout in seconds for wait operations"] | None = None,
     include_stack_trace: Annotated[bool, "Include stack traces in error reports"] | None = None,
+    aggregate_errors: Annotated[bool, "Collapse identical errors into one entry with a count (default true; ignored with stack traces)"] | None = None,
 ) -> dict[str, Any]:
     ctx.info(f"Processing compile_monitor: {action}")
-    
+    # Reject unknown actions before entering the handler's try block
+    if action not in _VALID_ACTIONS:
+        return {"success": False, "message": f"Unknown action: {action}"}
+
     try:
-        if action == "get_status":
-            return get_compile_status(ctx)
-        elif action == "wait_for_complete":
-            return wait_for_compilation_complete(ctx, timeout_seconds or 30)
-        elif action == "get_errors":
-            return get_compilation_errors(ctx, include_stack_trace or False)
-        elif action == "get_warnings":
-            return get_compilation_warnings(ctx)
-        elif action == "clear_errors":
-            return clear_compilation_errors(ctx)
-        elif action == "force_recompile":
-            return force_recompile(ctx)
-        else:
-            return {"success": False, "message": f"Unknown action: {action}"}
-            
+        return _ACTIONS[action](ctx, timeout_seconds, include_stack_trace, aggregate_errors)
     except Exception as e:
-        return {"success": False, "message": f"Python error in compile_monitor: {str(e)}"}
+        return {"success": False, "message": f"Python error in compile_monitor: {e}"}
+
+
+def _get_editor_flags(ctx: Context) -> tuple[bool, bool, bool, str | None]:
+    """Fetch only the editor compile flags: (is_compiling, is_updating, ok, error)."""
+    global _long_poll_supported
+    editor_response = send_command_with_retry("manage_editor", _REQ_EDITOR_STATE)
+    if not isinstance(editor_response, dict) or not editor_response.get("success"):
+        return False, False, False, "Failed to get editor state"
+
+    editor_data = editor_response.get("data", {})
+    if _long_poll_supported is None and editor_data.get("supportsWaitCompile"):
+        _long_poll_supported = True
+    return editor_data.get("isCompiling", False), editor_data.get("isUpdating", False), True, None
+
+
+def _is_unknown_action(response: Any) -> bool:
+    """Return True if Unity rejected the request because it does not know the action."""
+    if not isinstance(response, dict) or response.get("success"):
+        return False
+    text = response.get("error") or response.get("message") or ""
+    return "unknown action" in str(text).lower()
+
+
+def _snapshot(ctx: Context) -> dict[str, Any] | None:
+    """Fetch compile flags and error/warning console entries in a single round-trip.
+
+    Returns None when the Unity plugin does not support get_compile_snapshot, in
+    which case callers fall back to separate manage_editor/read_console calls.
+    """
+    global _snapshot_supported
+    if not _snapshot_supported:
+        return None
+
+    response = send_command_with_retry("manage_editor", _REQ_COMPILE_SNAPSHOT)
+    if _is_unknown_action(response):
+        _snapshot_supported = False
+        return None
+    return response if isinstance(response, dict) else {"success": False, "message": str(response)}
+
+
+def _coalesce(key: Any, fetch: Callable[[], Any]) -> Any:
+    """Run fetch() once for all concurrent callers sharing key.
+
+    Callers that join an in-flight request get a deep copy of its result, and so does
+    the caller that ran it if anyone joined, so no two callers share a mutable result.
+    """
+    with _inflight_lock:
+        entry = _inflight.get(key)
+        if entry is None:
+            future: Future = Future()
+            _inflight[key] = [future, 0]
+        else:
+            entry[1] += 1
+    if entry is not None:
+        return copy.deepcopy(entry[0].result())
+
+    try:
+        result = fetch()
+    except BaseException as e:
+        with _inflight_lock:
+            del _inflight[key]
+        future.set_exception(e)
+        raise
+    with _inflight_lock:
+        followers = _inflight.pop(key)[1]
+    future.set_result(result)
+    return copy.deepcopy(result) if followers else result
+
+
+def _invalidate_status_cache() -> None:
+    """Drop the memoized status and error results.
+
+    Invariant: every action that changes Unity's compile or console state calls this once
+    its request has been sent. A status read that races with the change can still be
+    memoized afterwards, but only for _STATUS_CACHE_TTL seconds.
+    """
+    with _status_lock:
+        _status_cache["v"] = None
+    with _err_lock:
+        _err_cache["ver"] = -1
 
 
 def get_compile_status(ctx: Context) -> dict[str, Any]:
-    """Get current compilation status."""
+    """Get current compilation status, reusing a result fetched within the last _STATUS_CACHE_TTL seconds."""
+    with _status_lock:
+        cached = _status_cache["v"]
+        if cached is not None and time.monotonic() - _status_cache["t"] < _STATUS_CACHE_TTL:
+            return copy.deepcopy(cached)
+
+    result = _coalesce("status", lambda: _fetch_compile_status(ctx))
+    if result.get("success"):
+        with _status_lock:
+            _status_cache["t"] = time.monotonic()
+            _status_cache["v"] = copy.deepcopy(result)
+    return result
+
+
+def _fetch_compile_status(ctx: Context) -> dict[str, Any]:
+    """Query Unity for the current compilation status."""
     try:
-        # Get editor state
-        editor_response = send_command_with_retry("manage_editor", {"action": "get_state"})
-        if not isinstance(editor_response, dict) or not editor_response.get("success"):
-            return {"success": False, "message": "Failed to get editor state"}
-        
-        editor_data = editor_response.get("data", {})
-        is_compiling = editor_data.get("isCompiling", False)
-        is_updating = editor_data.get("isUpdating", False)
-        
-        # Get console errors
-        console_response = send_command_with_retry("read_console", {"action": "get", "count": 50})
+        snapshot = _snapshot(ctx)
+        if snapshot is not None:
+            if not snapshot.get("success"):
+                error = snapshot.get("error") or snapshot.get("message") or "unknown error"
+                return {"success": False, "message": f"Failed to get compile snapshot: {error}"}
+            snapshot_data = snapshot.get("data", {})
+            is_compiling = snapshot_data.get("isCompiling", False)
+            is_updating = snapshot_data.get("isUpdating", False)
+            console_data = snapshot_data.get("entries", [])
+            # Set when Unity returned the flags but could not read the console
+            console_error = snapshot_data.get("entriesError")
+        else:
+            # Legacy path: editor state and console are fetched separately. The two calls are
+            # not overlapped on purpose: UnityConnection serializes every request on one socket
+            # (_io_lock), so a concurrent send would only queue behind the first one.
+            is_compiling, is_updating, ok, err = _get_editor_flags(ctx)
+            if not ok:
+                return {"success": False, "message": err}
+
+            # Unity filters by type, the loops below still filter for older plugins
+            console_response = send_command_with_retry("read_console", _REQ_CONSOLE_STATUS)
+            console_data = []
+            console_error = None
+            if isinstance(console_response, dict) and console_response.get("success"):
+                console_data = console_response.get("data", [])
+            elif isinstance(console_response, dict):
+                console_error = console_response.get("error") or console_response.get("message")
+
         errors = []
         warnings = []
-        
-        if isinstance(console_response, dict) and console_response.get("success"):
-            console_data = console_response.get("data", [])
-            for entry in console_data:
-                if entry.get("type") == "Error":
-                    errors.append({
-                        "message": entry.get("message", ""),
-                        "file": entry.get("file", ""),
-                        "line": entry.get("line", ""),
-                        "stackTrace": entry.get("stackTrace", "")
-                    })
-                elif entry.get("type") == "Warning":
-                    warnings.append({
-                        "message": entry.get("message", ""),
-                        "file": entry.get("file", ""),
-                        "line": entry.get("line", "")
-                    })
-        
+        add_error = errors.append
+        add_warning = warnings.append
+        for entry in console_data:
+            get = entry.get
+            entry_type = get("type")
+            if entry_type == "Error":
+                add_error({
+                    "message": get("message", ""),
+                    "file": get("file", ""),
+                    "line": get("line", ""),
+                    "stackTrace": get("stackTrace", "")
+                })
+            elif entry_type == "Warning":
+                add_warning({
+                    "message": get("message", ""),
+                    "file": get("file", ""),
+                    "line": get("line", "")
+                })
+
+        error_count, warning_count = len(errors), len(warnings)
+        data = {
+            "isCompiling": is_compiling,
+            "isUpdating": is_updating,
+            "hasErrors": error_count > 0,
+            "hasWarnings": warning_count > 0,
+            "errorCount": error_count,
+            "warningCount": warning_count,
+            "errors": errors,
+            "warnings": warnings,
+            "status": "compiling" if is_compiling else ("updating" if is_updating else "idle")
+        }
+        if console_error:
+            # The counts above are not a clean compile: the console could not be read
+            data["consoleError"] = console_error
         return {
             "success": True,
-            "message": "Compilation status retrieved",
-            "data": {
-                "isCompiling": is_compiling,
-                "isUpdating": is_updating,
-                "hasErrors": len(errors) > 0,
-                "hasWarnings": len(warnings) > 0,
-                "errorCount": len(errors),
-                "warningCount": len(warnings),
-                "errors": errors,
-                "warnings": warnings,
-                "status": "compiling" if is_compiling else ("updating" if is_updating else "idle")
-            }
+            "message": _MSG_STATUS_OK,
+            "data": data
         }
     except Exception as e:
-        return {"success": False, "message": f"Error getting compile status: {str(e)}"}
+        return {"success": False, "message": f"Error getting compile status: {e}"}
+
+
+def _long_poll_until_idle(deadline: float) -> bool | None:
+    """Block inside Unity (wait_compile_complete) until the editor is idle.
+
+    Returns True once idle, False when the deadline passes, or None when long-polling
+    is unavailable and the caller should fall back to polling the editor flags.
+    """
+    global _long_poll_supported
+    if not _long_poll_supported:
+        return None
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        window_ms = max(1, int(min(remaining, _LONG_POLL_WINDOW) * 1000))
+        try:
+            response = send_command_with_retry("wait_compile_complete", {"timeoutMs": window_ms})
+        except Exception as e:
+            if "unknown or unsupported command" in str(e).lower():
+                _long_poll_supported = False
+            return None
+
+        data = response.get("data") if isinstance(response, dict) and response.get("success") else None
+        if not isinstance(data, dict):
+            return None
+        if data.get("done"):
+            return True
 
 
 def wait_for_compilation_complete(ctx: Context, timeout_seconds: int) -> dict[str, Any]:
     """Wait for compilation to complete."""
     try:
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout_seconds:
-            status_response = get_compile_status(ctx)
-            if not status_response.get("success"):
-                return status_response
-            
-            status_data = status_response.get("data", {})
-            if not status_data.get("isCompiling", False) and not status_data.get("isUpdating", False):
-                return {
-                    "success": True,
-                    "message": "Compilation completed",
-                    "data": {
-                        "waitTime": time.time() - start_time,
-                        "finalStatus": status_data
-                    }
-                }
-            
-            time.sleep(0.5)  # Check every 500ms
-        
+        # Bound once: the backoff loop below runs on every poll tick
+        mono = time.monotonic
+        sleep = time.sleep
+        start_time = mono()
+        deadline = start_time + timeout_seconds
+
+        # Check the editor flags once up front so an already-idle editor returns in one
+        # round-trip. While busy, block inside Unity if the plugin advertised support for
+        # it; otherwise poll the flags with exponential backoff.
+        delay = _POLL_INITIAL_DELAY
+        try_long_poll = True
+        while True:
+            is_compiling, is_updating, ok, err = _get_editor_flags(ctx)
+            if not ok:
+                return {"success": False, "message": err}
+            if not is_compiling and not is_updating:
+                idle = True
+                break
+
+            if try_long_poll:
+                try_long_poll = False
+                idle = _long_poll_until_idle(deadline)
+                if idle is not None:
+                    break
+
+            remaining = deadline - mono()
+            if remaining <= 0:
+                idle = False
+                break
+            # Detect short compiles quickly without hammering the bridge on long ones
+            sleep(min(delay, remaining))
+            delay = min(delay * 2, _POLL_MAX_DELAY)
+
+        if not idle:
+            return {
+                "success": False,
+                "message": f"Compilation timeout after {timeout_seconds} seconds",
+                "data": {"timeout": True}
+            }
+
+        # The console is read once compilation settles. Bypass the memo: a cached
+        # result may predate the idle state we just observed.
+        status_response = _fetch_compile_status(ctx)
+        if not status_response.get("success"):
+            return status_response
         return {
-            "success": False,
-            "message": f"Compilation timeout after {timeout_seconds} seconds",
-            "data": {"timeout": True}
+            "success": True,
+            "message": _MSG_WAIT_DONE,
+            "data": {
+                "waitTime": mono() - start_time,
+                "finalStatus": status_response.get("data", {})
+            }
         }
     except Exception as e:
-        return {"success": False, "message": f"Error waiting for compilation: {str(e)}"}
+        return {"success": False, "message": f"Error waiting for compilation: {e}"}
+
+
+def _read_console_pages(request: dict[str, Any]) -> Any:
+    """Read console entries in pages of request["count"] until drained.
+
+    Returns the first response with 'data' replaced by every entry collected. Plugins
+    that do not report 'nextOffset' are read as a single page. At most
+    _CONSOLE_MAX_ENTRIES are kept. 'truncated' is set if more were available or a
+    later page failed. 'version' is dropped if the console changed between pages or
+    the result was truncated, so such a combined result is never cached.
+    Concurrent identical reads share one set of round-trips.
+    """
+    return _coalesce(("read_console", json.dumps(request, sort_keys=True)), lambda: _fetch_console_pages(request))
+
+
+def _fetch_console_pages(request: dict[str, Any]) -> Any:
+    response = send_command_with_retry("read_console", request)
+    if not isinstance(response, dict) or not response.get("success") or response.get("unchanged"):
+        return response
+
+    page_size = request["count"]
+    entries = list(response.get("data") or [])
+    version = response.get("version")
+    page_request = {k: v for k, v in request.items() if k != "ifChangedSince"}
+    page = response
+    truncated = False
+    while "nextOffset" in page and len(page.get("data") or []) >= page_size:
+        if len(entries) >= _CONSOLE_MAX_ENTRIES:
+            # A full last page may also be the end of the console; one entry past the cap decides
+            probe = send_command_with_retry(
+                "read_console", {**page_request, "offset": page["nextOffset"], "count": 1})
+            truncated = not (isinstance(probe, dict) and probe.get("success") and not probe.get("data"))
+            break
+        page = send_command_with_retry("read_console", {**page_request, "offset": page["nextOffset"]})
+        if not isinstance(page, dict) or not page.get("success"):
+            # e.g. Unity is reloading: what was read so far is incomplete
+            truncated = True
+            break
+        if page.get("version") != version:
+            version = None
+        entries.extend(page.get("data") or [])
+
+    if truncated or len(entries) > _CONSOLE_MAX_ENTRIES:
+        return {**response, "data": entries[:_CONSOLE_MAX_ENTRIES], "version": None, "truncated": True}
+    return {**response, "data": entries, "version": version}
 
 
-def get_compilation_errors(ctx: Context, include_stack_trace: bool) -> dict[str, Any]:
-    """Get detailed compilation errors."""
+def _cached_errors(version: Any, include_stack_trace: bool) -> list[dict[str, Any]] | None:
+    """Return a copy of the cached error list if it matches the console version, else None."""
+    if version is None:
+        return None
+    with _err_lock:
+        if (_err_cache["ver"] == version and _err_cache["withTrace"] == include_stack_trace
+                and _err_cache["errors"] is not None):
+            # Entries are flat dicts of scalars, so copying each dict is enough
+            return [dict(e) for e in _err_cache["errors"]]
+    return None
+
+
+def _aggregate_errors(errors: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Collapse identical (message, file, line) errors into one entry with a 'count', most frequent first."""
+    grouped: dict[tuple, dict[str, Any]] = {}
+    for error in errors:
+        key = (error["message"], error["file"], error["line"])
+        existing = grouped.get(key)
+        if existing is None:
+            grouped[key] = {**error, "count": 1}
+        else:
+            existing["count"] += 1
+    # sorted() is stable, so equally frequent errors keep console order
+    return sorted(grouped.values(), key=lambda error: error["count"], reverse=True)
+
+
+def get_compilation_errors(ctx: Context, include_stack_trace: bool, aggregate: bool = True) -> dict[str, Any]:
+    """Get detailed compilation errors, deduplicated unless aggregate is False or stack traces are requested."""
     try:
-        console_response = send_command_with_retry("read_console", {"action": "get", "count": 100})
-        errors = []
-        
-        if isinstance(console_response, dict) and console_response.get("success"):
-            console_data = console_response.get("data", [])
-            for entry in console_data:
-                if entry.get("type") == "Error":
-                    error_info = {
-                        "message": entry.get("message", ""),
-                        "file": entry.get("file", ""),
-                        "line": entry.get("line", "")
-                    }
-                    if include_stack_trace and entry.get("stackTrace"):
-                        error_info["stackTrace"] = entry.get("stackTrace", "")
-                    errors.append(error_info)
-        
+        base_request = _REQ_CONSOLE_ERRORS_TRACE if include_stack_trace else _REQ_CONSOLE_ERRORS
+        request = base_request
+        with _err_lock:
+            if _err_cache["ver"] != -1 and _err_cache["withTrace"] == include_stack_trace:
+                # Unity answers with just {unchanged, version} if the console has not changed
+                request = {**base_request, "ifChangedSince": _err_cache["ver"]}
+        console_response = _read_console_pages(request)
+        ok = isinstance(console_response, dict) and console_response.get("success")
+        version = console_response.get("version") if ok else None
+
+        truncated = False
+        errors = _cached_errors(version, include_stack_trace)
+        if errors is None:
+            if ok and console_response.get("unchanged"):
+                # Cache was invalidated while the request was in flight; fetch the entries again
+                console_response = _read_console_pages(base_request)
+                ok = isinstance(console_response, dict) and console_response.get("success")
+                version = console_response.get("version") if ok else None
+
+            console_data = []
+            if ok:
+                console_data = console_response.get("data", [])
+                truncated = bool(console_response.get("truncated"))
+
+            if include_stack_trace:
+                errors = [
+                    {"message": (get := e.get)("message", ""), "file": get("file", ""), "line": get("line", ""),
+                     **({"stackTrace": get("stackTrace")} if get("stackTrace") else {})}
+                    for e in console_data if e.get("type") == "Error"
+                ]
+            else:
+                errors = [
+                    {"message": (get := e.get)("message", ""), "file": get("file", ""), "line": get("line", "")}
+                    for e in console_data if e.get("type") == "Error"
+                ]
+
+            if version is not None:
+                with _err_lock:
+                    _err_cache["ver"] = version
+                    _err_cache["errors"] = [dict(e) for e in errors]
+                    _err_cache["withTrace"] = include_stack_trace
+
+        error_count = len(errors)
+        data = {"errorCount": error_count}
+        if truncated:
+            # Only the first _CONSOLE_MAX_ENTRIES console entries were read
+            data["truncated"] = True
+        # Stack traces make every entry unique, so there is nothing to collapse
+        if aggregate and not include_stack_trace:
+            errors = _aggregate_errors(errors)
+            data["uniqueErrorCount"] = len(errors)
+        data["errors"] = errors
+
         return {
             "success": True,
-            "message": f"Retrieved {len(errors)} compilation errors",
-            "data": {
-                "errorCount": len(errors),
-                "errors": errors
-            }
+            "message": _MSG_ERRORS_FMT % error_count,
+            "data": data
         }
     except Exception as e:
-        return {"success": False, "message": f"Error getting compilation errors: {str(e)}"}
+        return {"success": False, "message": f"Error getting compilation errors: {e}"}
 
 
 def get_compilation_warnings(ctx: Context) -> dict[str, Any]:
     """Get compilation warnings."""
     try:
-        console_response = send_command_with_retry("read_console", {"action": "get", "count": 100})
-        warnings = []
-        
+        console_response = _read_console_pages(_REQ_CONSOLE_WARNINGS)
+        console_data = []
+        truncated = False
         if isinstance(console_response, dict) and console_response.get("success"):
             console_data = console_response.get("data", [])
-            for entry in console_data:
-                if entry.get("type") == "Warning":
-                    warnings.append({
-                        "message": entry.get("message", ""),
-                        "file": entry.get("file", ""),
-                        "line": entry.get("line", "")
-                    })
-        
+            truncated = bool(console_response.get("truncated"))
+
+        warnings = [
+            {"message": (get := e.get)("message", ""), "file": get("file", ""), "line": get("line", "")}
+            for e in console_data if e.get("type") == "Warning"
+        ]
+
+        data = {"warningCount": len(warnings)}
+        if truncated:
+            # Only the first _CONSOLE_MAX_ENTRIES console entries were read
+            data["truncated"] = True
+        data["warnings"] = warnings
         return {
             "success": True,
-            "message": f"Retrieved {len(warnings)} compilation warnings",
-            "data": {
-                "warningCount": len(warnings),
-                "warnings": warnings
-            }
+            "message": _MSG_WARNINGS_FMT % len(warnings),
+            "data": data
         }
     except Exception as e:
-        return {"success": False, "message": f"Error getting compilation warnings: {str(e)}"}
+        return {"success": False, "message": f"Error getting compilation warnings: {e}"}
 
 
 def clear_compilation_errors(ctx: Context) -> dict[str, Any]:
     """Clear console errors."""
     try:
-        console_response = send_command_with_retry("read_console", {"action": "clear"})
+        console_response = send_command_with_retry("read_console", _REQ_CONSOLE_CLEAR)
+        _invalidate_status_cache()
         return console_response if isinstance(console_response, dict) else {"success": False, "message": str(console_response)}
     except Exception as e:
-        return {"success": False, "message": f"Error clearing compilation errors: {str(e)}"}
+        return {"success": False, "message": f"Error clearing compilation errors: {e}"}
 
 
 def force_recompile(ctx: Context) -> dict[str, Any]:
     """Force Unity to recompile all scripts."""
+    global _trigger_recompile_supported
     try:
-        # Use menu item to force recompilation
-        menu_response = send_command_with_retry("execute_menu_item", {"menuPath": "Assets/Refresh"})
-        if isinstance(menu_response, dict) and menu_response.get("success"):
+        response = None
+        if _trigger_recompile_supported:
+            # Ask Unity to refresh and compile directly, skipping the menu system
+            response = send_command_with_retry("manage_editor", _REQ_TRIGGER_RECOMPILE)
+            if _is_unknown_action(response):
+                _trigger_recompile_supported = False
+                response = None
+        if response is None:
+            # Older plugins: use the menu item to force recompilation
+            response = send_command_with_retry("execute_menu_item", _REQ_MENU_REFRESH)
+        _invalidate_status_cache()
+
+        if isinstance(response, dict) and response.get("success"):
             return {
                 "success": True,
-                "message": "Forced recompilation initiated",
+                "message": _MSG_RECOMPILE_OK,
                 "data": {"recompileTriggered": True}
             }
-        return menu_response if isinstance(menu_response, dict) else {"success": False, "message": str(menu_response)}
+        return response if isinstance(response, dict) else {"success": False, "message": str(response)}
     except Exception as e:
-        return {"success": False, "message": f"Error forcing recompilation: {str(e)}"}
+        return {"success": False, "message": f"Error forcing recompilation: {e}"}
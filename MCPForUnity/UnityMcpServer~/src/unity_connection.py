@@ -15,6 +15,13 @@ from typing import Any, Dict
 
 from models import MCPResponse
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore
+    HAS_ORJSON = False
+
 
 # Configure logging using settings from config
 logging.basicConfig(
@@ -30,6 +37,17 @@ _connection_lock = threading.Lock()
 FRAMED_MAX = 64 * 1024 * 1024
 
 
+def _parse_response(data: bytes) -> Any:
+    """Decode a Unity response, using orjson when it is installed."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. rejects NaN); let json decide or raise as before
+            pass
+    return json.loads(data.decode('utf-8'))
+
+
 @dataclass
 class UnityConnection:
     """Manages the socket connection to the Unity Editor."""
@@ -295,8 +313,10 @@ class UnityConnection:
                     restore_timeout = None
                     if attempt > 0 and last_short_timeout is None:
                         restore_timeout = self.sock.gettimeout()
-                        # Use longer timeout for script validation operations
-                        timeout_duration = 30.0 if command_type in ['validate_script', 'manage_script'] else 1.0
+                        # Use longer timeout for script validation operations and for the
+                        # compile long-poll, which deliberately holds the reply for seconds
+                        timeout_duration = 30.0 if command_type in [
+                            'validate_script', 'manage_script', 'wait_compile_complete'] else 1.0
                         self.sock.settimeout(timeout_duration)
                     try:
                         response_data = self.receive_full_response(self.sock)
@@ -310,12 +330,12 @@ class UnityConnection:
 
                 # Parse
                 if command_type == 'ping':
-                    resp = json.loads(response_data.decode('utf-8'))
+                    resp = _parse_response(response_data)
                     if resp.get('status') == 'success' and resp.get('result', {}).get('message') == 'pong':
                         return {"message": "pong"}
                     raise Exception("Ping unsuccessful")
 
-                resp = json.loads(response_data.decode('utf-8'))
+                resp = _parse_response(response_data)
                 if resp.get('status') == 'error':
                     err = resp.get('error') or resp.get(
                         'message', 'Unknown Unity error')
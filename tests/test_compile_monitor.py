@@ -0,0 +1,560 @@
+import sys
+import pathlib
+import importlib.util
+import types
+import os
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+SRC = ROOT / "MCPForUnity" / "UnityMcpServer~" / "src"
+sys.path.insert(0, str(SRC))
+
+
+def _load_module(path: pathlib.Path, name: str):
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load module {name} from {path}")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# Stub fastmcp to avoid real MCP deps
+fastmcp_pkg = types.ModuleType("fastmcp")
+
+
+class _Dummy:
+    pass
+
+
+fastmcp_pkg.FastMCP = _Dummy
+fastmcp_pkg.Context = _Dummy
+sys.modules.setdefault("fastmcp", fastmcp_pkg)
+
+
+from tests.test_helpers import DummyContext
+
+
+def _load_compile_monitor():
+    # Import with SRC as CWD to satisfy telemetry import side effects
+    _prev = os.getcwd()
+    os.chdir(str(SRC))
+    try:
+        return _load_module(SRC / "tools" / "compile_monitor.py", "compile_monitor_mod")
+    finally:
+        os.chdir(_prev)
+
+
+def _editor_state(is_compiling=False, is_updating=False):
+    return {"success": True, "data": {"isCompiling": is_compiling, "isUpdating": is_updating}}
+
+
+def test_wait_returns_immediately_when_idle(monkeypatch):
+    mod = _load_compile_monitor()
+    calls = []
+    sleeps = []
+
+    def fake_send(cmd, params):
+        calls.append(cmd)
+        if cmd == "manage_editor":
+            return _editor_state()
+        return {"success": True, "data": []}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+    monkeypatch.setattr(mod.time, "sleep", sleeps.append)
+
+    resp = mod.wait_for_compilation_complete(DummyContext(), 30)
+    assert resp["success"] is True
+    assert resp["data"]["finalStatus"]["status"] == "idle"
+    assert sleeps == []
+    # One flag check, then the final status read
+    assert calls == ["manage_editor", "manage_editor"]
+
+
+def test_wait_backs_off_exponentially(monkeypatch):
+    mod = _load_compile_monitor()
+    states = iter([True, True, True, True, True])
+    sleeps = []
+    calls = []
+
+    def fake_send(cmd, params):
+        calls.append((cmd, params.get("action")))
+        if cmd == "manage_editor" and params.get("action") == "get_state":
+            # Older plugins do not advertise supportsWaitCompile
+            return _editor_state(is_compiling=next(states, False))
+        return {"success": True, "data": {"isCompiling": False, "isUpdating": False, "entries": []}}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+    monkeypatch.setattr(mod.time, "sleep", sleeps.append)
+
+    resp = mod.wait_for_compilation_complete(DummyContext(), 30)
+    assert resp["success"] is True
+    assert sleeps == [0.025, 0.05, 0.1, 0.2, 0.4]
+    # Polling only touches the editor state and never probes the long-poll command;
+    # the console is read once at the end
+    assert [c for c in calls if c != ("manage_editor", "get_state")] == [
+        ("manage_editor", "get_compile_snapshot")]
+    assert mod._long_poll_supported is None
+
+
+def test_wait_long_polls_in_unity(monkeypatch):
+    mod = _load_compile_monitor()
+    calls = []
+    sleeps = []
+    results = iter([False, True])
+
+    def fake_send(cmd, params):
+        calls.append((cmd, params.get("action")))
+        if cmd == "wait_compile_complete":
+            assert 0 < params["timeoutMs"] <= 5000
+            done = next(results)
+            return {"success": True, "data": {"done": done, "timeout": not done}}
+        if params.get("action") == "get_state":
+            return {"success": True, "data": {"isCompiling": True, "isUpdating": False,
+                                              "supportsWaitCompile": True}}
+        return {"success": True, "data": {"isCompiling": False, "isUpdating": False, "entries": []}}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+    monkeypatch.setattr(mod.time, "sleep", sleeps.append)
+
+    resp = mod.wait_for_compilation_complete(DummyContext(), 30)
+    assert resp["success"] is True
+    assert resp["data"]["finalStatus"]["status"] == "idle"
+    assert calls == [
+        ("manage_editor", "get_state"),
+        ("wait_compile_complete", None),
+        ("wait_compile_complete", None),
+        ("manage_editor", "get_compile_snapshot"),
+    ]
+    assert sleeps == []
+
+
+def test_wait_falls_back_when_advertised_long_poll_is_rejected(monkeypatch):
+    mod = _load_compile_monitor()
+    states = iter([True, True])
+    sleeps = []
+    long_polls = []
+
+    def fake_send(cmd, params):
+        if cmd == "wait_compile_complete":
+            long_polls.append(params)
+            raise Exception("Unknown or unsupported command type: wait_compile_complete")
+        if params.get("action") == "get_state":
+            return {"success": True, "data": {"isCompiling": next(states, False), "isUpdating": False,
+                                              "supportsWaitCompile": True}}
+        return {"success": True, "data": {"isCompiling": False, "isUpdating": False, "entries": []}}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+    monkeypatch.setattr(mod.time, "sleep", sleeps.append)
+
+    assert mod.wait_for_compilation_complete(DummyContext(), 30)["success"] is True
+    assert len(long_polls) == 1
+    assert sleeps == [0.025, 0.05]
+    assert mod._long_poll_supported is False
+
+
+def test_console_reads_push_type_filter_to_unity(monkeypatch):
+    mod = _load_compile_monitor()
+    captured = []
+
+    def fake_send(cmd, params):
+        captured.append(params)
+        # Older plugins ignore 'types' and return everything
+        return {"success": True, "data": [
+            {"type": "Log", "message": "hello"},
+            {"type": "Error", "message": "boom", "file": "A.cs", "line": 3},
+            {"type": "Warning", "message": "careful", "file": "B.cs", "line": 7},
+        ]}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    errors = mod.get_compilation_errors(DummyContext(), False)
+    assert captured[-1]["types"] == ["error"]
+    assert errors["data"]["errors"] == [{"message": "boom", "file": "A.cs", "line": 3, "count": 1}]
+
+    warnings = mod.get_compilation_warnings(DummyContext())
+    assert captured[-1]["types"] == ["warning"]
+    assert warnings["data"]["warnings"] == [{"message": "careful", "file": "B.cs", "line": 7}]
+
+
+def test_status_uses_single_snapshot_round_trip(monkeypatch):
+    mod = _load_compile_monitor()
+    calls = []
+
+    def fake_send(cmd, params):
+        calls.append((cmd, params.get("action")))
+        return {"success": True, "data": {
+            "isCompiling": False,
+            "isUpdating": True,
+            "entries": [
+                {"type": "Error", "message": "boom", "file": "A.cs", "line": 3, "stackTrace": "at A"},
+                {"type": "Warning", "message": "careful", "file": "B.cs", "line": 7},
+            ],
+        }}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    resp = mod.get_compile_status(DummyContext())
+    assert calls == [("manage_editor", "get_compile_snapshot")]
+    assert resp["data"]["status"] == "updating"
+    assert resp["data"]["errorCount"] == 1
+    assert resp["data"]["warningCount"] == 1
+
+
+def test_status_falls_back_when_snapshot_unsupported(monkeypatch):
+    mod = _load_compile_monitor()
+    calls = []
+
+    def fake_send(cmd, params):
+        calls.append((cmd, params.get("action")))
+        if cmd == "manage_editor" and params["action"] == "get_compile_snapshot":
+            return {"success": False, "error": "Unknown action: 'get_compile_snapshot'."}
+        if cmd == "manage_editor":
+            return _editor_state()
+        return {"success": True, "data": [{"type": "Error", "message": "boom", "file": "A.cs", "line": 3}]}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    resp = mod.get_compile_status(DummyContext())
+    assert resp["data"]["errorCount"] == 1
+    assert calls == [
+        ("manage_editor", "get_compile_snapshot"),
+        ("manage_editor", "get_state"),
+        ("read_console", "get"),
+    ]
+
+    # The unsupported snapshot is remembered and not probed again
+    calls.clear()
+    mod._status_cache["v"] = None
+    mod.get_compile_status(DummyContext())
+    assert calls == [("manage_editor", "get_state"), ("read_console", "get")]
+
+
+def test_status_is_memoized_until_invalidated(monkeypatch):
+    mod = _load_compile_monitor()
+    calls = []
+
+    def fake_send(cmd, params):
+        calls.append((cmd, params.get("action")))
+        return {"success": True, "data": {"isCompiling": False, "isUpdating": False, "entries": []}}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    first = mod.get_compile_status(DummyContext())
+    first["data"]["errors"].append("mutated by caller")
+    second = mod.get_compile_status(DummyContext())
+    assert len(calls) == 1
+    assert second["data"]["errors"] == []
+
+    mod.clear_compilation_errors(DummyContext())
+    calls.clear()
+    mod.get_compile_status(DummyContext())
+    assert calls == [("manage_editor", "get_compile_snapshot")]
+
+
+def test_errors_include_stack_trace_only_when_present(monkeypatch):
+    mod = _load_compile_monitor()
+    captured = []
+
+    def fake_send(cmd, params):
+        captured.append(params)
+        return {"success": True, "data": [
+            {"type": "Error", "message": "boom", "file": "A.cs", "line": 3, "stackTrace": "at A"},
+            {"type": "Error", "message": "bang", "file": "B.cs", "line": 4, "stackTrace": None},
+        ]}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    resp = mod.get_compilation_errors(DummyContext(), True)
+    assert captured[-1]["includeStacktrace"] is True
+    assert resp["data"]["errors"] == [
+        {"message": "boom", "file": "A.cs", "line": 3, "stackTrace": "at A"},
+        {"message": "bang", "file": "B.cs", "line": 4},
+    ]
+
+
+def test_errors_reuse_cache_while_console_version_unchanged(monkeypatch):
+    mod = _load_compile_monitor()
+    captured = []
+
+    def fake_send(cmd, params):
+        captured.append(dict(params))
+        if params.get("action") == "clear":
+            return {"success": True, "message": "Console cleared successfully."}
+        if params.get("ifChangedSince") == 7:
+            return {"success": True, "unchanged": True, "version": 7}
+        return {"success": True, "version": 7, "data": [
+            {"type": "Error", "message": "boom", "file": "A.cs", "line": 3},
+        ]}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    first = mod.get_compilation_errors(DummyContext(), False)
+    assert "ifChangedSince" not in captured[-1]
+    # Stack traces are not transferred when they would be discarded
+    assert captured[-1]["includeStacktrace"] is False
+    first["data"]["errors"].clear()
+
+    second = mod.get_compilation_errors(DummyContext(), False)
+    assert captured[-1]["ifChangedSince"] == 7
+    assert second["data"]["errors"] == [{"message": "boom", "file": "A.cs", "line": 3, "count": 1}]
+
+    # Clearing the console drops the cached token
+    mod.clear_compilation_errors(DummyContext())
+    mod.get_compilation_errors(DummyContext(), False)
+    assert "ifChangedSince" not in captured[-1]
+    # The shared request payload is never modified
+    assert mod._REQ_CONSOLE_ERRORS == {"action": "get", "count": mod._CONSOLE_PAGE_SIZE, "types": ["error"],
+                                       "includeStacktrace": False}
+
+
+def test_compile_monitor_dispatches_actions(monkeypatch):
+    mod = _load_compile_monitor()
+    seen = []
+    monkeypatch.setattr(mod, "wait_for_compilation_complete",
+                        lambda ctx, timeout: seen.append(("wait", timeout)) or {"success": True})
+    monkeypatch.setattr(mod, "get_compilation_errors",
+                        lambda ctx, trace, aggregate: seen.append(("errors", trace, aggregate)) or {"success": True})
+
+    assert mod.compile_monitor(DummyContext(), "wait_for_complete")["success"] is True
+    assert mod.compile_monitor(DummyContext(), "wait_for_complete", timeout_seconds=5)["success"] is True
+    assert mod.compile_monitor(DummyContext(), "wait_for_complete", timeout_seconds=0)["success"] is True
+    assert mod.compile_monitor(DummyContext(), "get_errors", include_stack_trace=True)["success"] is True
+    assert mod.compile_monitor(DummyContext(), "get_errors", aggregate_errors=False)["success"] is True
+    assert seen == [("wait", 30), ("wait", 5), ("wait", 30), ("errors", True, True), ("errors", False, False)]
+
+    resp = mod.compile_monitor(DummyContext(), "bogus")
+    assert resp == {"success": False, "message": "Unknown action: bogus"}
+
+
+def test_warnings_are_read_in_pages_until_drained(monkeypatch):
+    mod = _load_compile_monitor()
+    console = [{"type": "Warning", "message": f"w{i}", "file": "A.cs", "line": i} for i in range(1200)]
+    offsets = []
+
+    def fake_send(cmd, params):
+        assert params["includeStacktrace"] is False
+        offset = params.get("offset", 0)
+        offsets.append(offset)
+        page = console[offset:offset + params["count"]]
+        return {"success": True, "data": page, "version": 1, "nextOffset": offset + len(page)}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    resp = mod.get_compilation_warnings(DummyContext())
+    assert offsets == [0, 500, 1000]
+    assert resp["data"]["warningCount"] == 1200
+    assert resp["data"]["warnings"][-1]["message"] == "w1199"
+
+
+def test_console_read_is_single_page_for_older_plugins(monkeypatch):
+    mod = _load_compile_monitor()
+    calls = []
+
+    def fake_send(cmd, params):
+        calls.append(params)
+        return {"success": True, "data": [{"type": "Warning", "message": "w"}] * params["count"]}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    resp = mod.get_compilation_warnings(DummyContext())
+    assert len(calls) == 1
+    assert resp["data"]["warningCount"] == mod._CONSOLE_PAGE_SIZE
+
+
+def test_force_recompile_prefers_direct_compile_request(monkeypatch):
+    mod = _load_compile_monitor()
+    calls = []
+    supported = {"value": True}
+
+    def fake_send(cmd, params):
+        calls.append((cmd, params.get("action") or params.get("menuPath")))
+        if cmd == "manage_editor" and not supported["value"]:
+            return {"success": False, "error": "Unknown action: 'trigger_recompile'."}
+        return {"success": True}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    assert mod.force_recompile(DummyContext())["data"] == {"recompileTriggered": True}
+    assert calls == [("manage_editor", "trigger_recompile")]
+
+    # Older plugins fall back to the Assets/Refresh menu item
+    supported["value"] = False
+    calls.clear()
+    assert mod.force_recompile(DummyContext())["success"] is True
+    assert calls == [("manage_editor", "trigger_recompile"), ("execute_menu_item", "Assets/Refresh")]
+    calls.clear()
+    mod.force_recompile(DummyContext())
+    assert calls == [("execute_menu_item", "Assets/Refresh")]
+
+
+def test_errors_are_aggregated_by_message_file_and_line(monkeypatch):
+    mod = _load_compile_monitor()
+    entries = [
+        {"type": "Error", "message": "CS0246", "file": "A.cs", "line": 3},
+        {"type": "Error", "message": "CS0103", "file": "B.cs", "line": 9},
+        {"type": "Error", "message": "CS0103", "file": "B.cs", "line": 9},
+        {"type": "Error", "message": "CS0246", "file": "A.cs", "line": 4},
+        {"type": "Error", "message": "CS0103", "file": "B.cs", "line": 9},
+    ]
+    monkeypatch.setattr(mod, "send_command_with_retry", lambda cmd, params: {"success": True, "data": entries})
+
+    resp = mod.get_compilation_errors(DummyContext(), False)
+    assert resp["message"] == "Retrieved 5 compilation errors"
+    assert resp["data"]["errorCount"] == 5
+    assert resp["data"]["uniqueErrorCount"] == 3
+    assert resp["data"]["errors"] == [
+        {"message": "CS0103", "file": "B.cs", "line": 9, "count": 3},
+        {"message": "CS0246", "file": "A.cs", "line": 3, "count": 1},
+        {"message": "CS0246", "file": "A.cs", "line": 4, "count": 1},
+    ]
+
+    raw = mod.get_compilation_errors(DummyContext(), False, aggregate=False)
+    assert len(raw["data"]["errors"]) == 5
+    assert "uniqueErrorCount" not in raw["data"]
+
+
+def test_concurrent_status_calls_share_one_request(monkeypatch):
+    import threading
+
+    mod = _load_compile_monitor()
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def fake_send(cmd, params):
+        calls.append((cmd, params.get("action")))
+        started.set()
+        release.wait(2)
+        return {"success": True, "data": {"isCompiling": False, "isUpdating": False, "entries": []}}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(mod.get_compile_status(DummyContext())))
+    leader.start()
+    assert started.wait(2)
+    follower = threading.Thread(target=lambda: results.append(mod.get_compile_status(DummyContext())))
+    follower.start()
+    # Let the follower reach the in-flight request before the leader finishes
+    deadline = time.monotonic() + 2
+    while not mod._inflight["status"][1] and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert mod._inflight["status"][1] == 1, "follower never joined the in-flight request"
+    release.set()
+    leader.join(2)
+    follower.join(2)
+
+    assert calls == [("manage_editor", "get_compile_snapshot")]
+    assert len(results) == 2
+    assert results[0] == results[1]
+    assert results[0] is not results[1]
+    assert not mod._inflight
+
+
+def test_force_recompile_invalidates_status_and_error_caches(monkeypatch):
+    mod = _load_compile_monitor()
+    calls = []
+
+    def fake_send(cmd, params):
+        calls.append((cmd, params.get("action")))
+        if cmd == "read_console":
+            return {"success": True, "data": [], "version": 7}
+        return {"success": True, "data": {"isCompiling": False, "isUpdating": False, "entries": []}}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    mod.get_compile_status(DummyContext())
+    mod.get_compilation_errors(DummyContext(), False)
+    assert mod._status_cache["v"] is not None
+    assert mod._err_cache["ver"] == 7
+
+    assert mod.force_recompile(DummyContext())["success"] is True
+    assert mod._status_cache["v"] is None
+    assert mod._err_cache["ver"] == -1
+
+    calls.clear()
+    mod.get_compile_status(DummyContext())
+    assert calls == [("manage_editor", "get_compile_snapshot")]
+
+
+def test_status_reports_unity_error_when_snapshot_fails(monkeypatch):
+    mod = _load_compile_monitor()
+
+    def fake_send(cmd, params):
+        return {"success": False, "error": "Error getting compile snapshot: boom"}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    resp = mod.get_compile_status(DummyContext())
+    assert resp == {"success": False,
+                    "message": "Failed to get compile snapshot: Error getting compile snapshot: boom"}
+
+
+def test_console_read_is_flagged_when_capped(monkeypatch):
+    mod = _load_compile_monitor()
+    monkeypatch.setattr(mod, "_CONSOLE_MAX_ENTRIES", 1000)
+    console = [{"type": "Error", "message": f"e{i}", "file": "A.cs", "line": i} for i in range(1200)]
+
+    def fake_send(cmd, params):
+        offset = params.get("offset", 0)
+        page = console[offset:offset + params["count"]]
+        return {"success": True, "data": page, "version": 1, "nextOffset": offset + len(page)}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    resp = mod.get_compilation_errors(DummyContext(), False)
+    assert resp["data"]["errorCount"] == 1000
+    assert resp["data"]["truncated"] is True
+    # A capped list is not cached against the console version
+    assert mod._err_cache["ver"] == -1
+
+    # Exactly at the cap: nothing was left, so the list is complete and cacheable
+    console[:] = console[:1000]
+    resp = mod.get_compilation_errors(DummyContext(), False)
+    assert resp["data"]["errorCount"] == 1000
+    assert "truncated" not in resp["data"]
+    assert mod._err_cache["ver"] == 1
+
+
+def test_failed_console_page_is_not_cached(monkeypatch):
+    mod = _load_compile_monitor()
+    console = [{"type": "Error", "message": f"e{i}", "file": "A.cs", "line": i} for i in range(700)]
+    reloading = [True]
+
+    def fake_send(cmd, params):
+        offset = params.get("offset", 0)
+        if offset and reloading[0]:
+            return {"success": False, "error": "reloading"}
+        if params.get("ifChangedSince") == 1:
+            return {"success": True, "unchanged": True, "version": 1}
+        page = console[offset:offset + params["count"]]
+        return {"success": True, "data": page, "version": 1, "nextOffset": offset + len(page)}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    first = mod.get_compilation_errors(DummyContext(), False)
+    assert first["data"]["errorCount"] == 500
+    assert first["data"]["truncated"] is True
+    assert mod._err_cache["ver"] == -1
+
+    reloading[0] = False
+    second = mod.get_compilation_errors(DummyContext(), False)
+    assert second["data"]["errorCount"] == 700
+    assert "truncated" not in second["data"]
+
+
+def test_status_reports_console_error_from_snapshot(monkeypatch):
+    mod = _load_compile_monitor()
+
+    def fake_send(cmd, params):
+        return {"success": True, "data": {"isCompiling": False, "isUpdating": False, "entries": [],
+                                          "entriesError": "LogEntries unavailable"}}
+
+    monkeypatch.setattr(mod, "send_command_with_retry", fake_send)
+
+    resp = mod.get_compile_status(DummyContext())
+    assert resp["success"] is True
+    assert resp["data"]["status"] == "idle"
+    assert resp["data"]["errorCount"] == 0
+    assert resp["data"]["consoleError"] == "LogEntries unavailable"
@@ -202,6 +202,33 @@ def test_zero_length_payload_heartbeat():
         conn.disconnect()
 
 
+def test_parse_response_uses_orjson_when_available(monkeypatch):
+    import unity_connection
+    if not unity_connection.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+
+    def _json_loads(*_args, **_kwargs):
+        raise AssertionError("json.loads should not be used when orjson parses the payload")
+
+    monkeypatch.setattr(unity_connection.json, "loads", _json_loads)
+    resp = unity_connection._parse_response('{"status":"success","result":{"msg":"héllo"}}'.encode("utf-8"))
+    assert resp == {"status": "success", "result": {"msg": "héllo"}}
+
+
+def test_parse_response_falls_back_to_json(monkeypatch):
+    import math
+    import unity_connection
+
+    # orjson rejects NaN literals; json accepts them
+    resp = unity_connection._parse_response(b'{"status":"success","result":{"value":NaN}}')
+    assert math.isnan(resp["result"]["value"])
+
+    monkeypatch.setattr(unity_connection, "HAS_ORJSON", False)
+    assert unity_connection._parse_response(b'{"status":"success"}') == {"status": "success"}
+    with pytest.raises(json.JSONDecodeError):
+        unity_connection._parse_response(b'{"status":')
+
+
 @pytest.mark.skip(reason="TODO: oversized payload should disconnect")
 def test_oversized_payload_rejected():
     pass